@@ -2,6 +2,7 @@
 
 
 import os
+import subprocess
 import logging
 
 # Set up logging
@@ -9,20 +10,31 @@ logger = logging.getLogger(__name__)
 
 class AudioNotifier:
     """Handle system sound notifications."""
-    
+
+    PLAYER = '/usr/bin/afplay'
+
     SOUNDS = {
         'start': '/System/Library/Sounds/Pop.aiff',
         'stop': '/System/Library/Sounds/Bottle.aiff',
         'success': '/System/Library/Sounds/Glass.aiff',
         'error': '/System/Library/Sounds/Basso.aiff'
     }
-    
+
+    # Sound files present on this system, checked once at import
+    _VALID = {k: v for k, v in SOUNDS.items() if os.path.exists(v)}
+
     @staticmethod
     def play_sound(sound_type: str) -> None:
         try:
-            if sound_type in AudioNotifier.SOUNDS:
-                sound_file = AudioNotifier.SOUNDS[sound_type]
-                if os.path.exists(sound_file):
-                    os.system(f'afplay {sound_file} &')
+            sound_file = AudioNotifier._VALID.get(sound_type)
+            if sound_file:
+                # Launch afplay directly in the background, without a shell
+                subprocess.Popen(
+                    [AudioNotifier.PLAYER, sound_file],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True
+                )
         except Exception as e:
-            logger.error(f"Error playing sound: {e}") 
\ No newline at end of file
+            logger.error(f"Error playing sound: {e}")
@@ -1,17 +1,25 @@
 #app/core/audio_processor.py
 
-from typing import Optional, Set, List
-import os
+from typing import Optional, List, Tuple, Iterable
 import time
-import wave
 from datetime import datetime
-from threading import Thread
+from threading import Thread, Event
 import logging
+import queue
 import numpy as np
 import sounddevice as sd
+import soundfile as sf
+
+# rtmixer is an optional extra; when installed, its C callback records without taking the GIL
+try:
+    import rtmixer
+except ImportError:
+    rtmixer = None
+# model_manager sets the OpenMP/MKL thread environment, so it must load before CTranslate2
+from app.models.model_manager import ModelManager
 from faster_whisper import WhisperModel
+from faster_whisper.vad import VadOptions, get_speech_timestamps
 import pyperclip
-from pynput import keyboard
 import rumps
 import atexit
 import gc
@@ -20,13 +28,43 @@ import multiprocessing.resource_tracker
 import signal
 import sys
 
-from app.models.model_manager import ModelManager
 from app.core.text_processor import process_text
 from app.common.notifier import AudioNotifier
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Sample rate Whisper models operate on
+WHISPER_SAMPLE_RATE = 16000
+
+# Capture rate used when the input device rejects 16kHz
+FALLBACK_SAMPLE_RATE = 48000
+
+# Low-pass FIR applied before decimating fallback-rate capture to 16kHz: a Hamming-windowed
+# sinc with its cutoff just below the 8kHz output Nyquist, normalized to unity gain at DC
+DECIMATION_FACTOR = FALLBACK_SAMPLE_RATE // WHISPER_SAMPLE_RATE
+_DECIMATION_TAPS = np.arange(63) - 31
+DECIMATION_FILTER = (np.sinc(_DECIMATION_TAPS * 0.9 / DECIMATION_FACTOR) * np.hamming(63)).astype(np.float32)
+DECIMATION_FILTER /= DECIMATION_FILTER.sum()
+
+# Upper bound on a single recording, used to size the capture buffer
+MAX_RECORDING_SECONDS = 600
+
+# Recordings longer than this go through the batched pipeline
+BATCHED_MIN_SECONDS = 30
+
+# Silence gap (ms) that splits speech regions during VAD
+VAD_MIN_SILENCE_MS = 500
+
+# Average segment log probability below which greedy output is re-decoded with beam search
+LOW_CONFIDENCE_LOGPROB = -1.0
+
+# Minimum seconds between partial clipboard updates during transcription
+CLIPBOARD_UPDATE_INTERVAL = 0.5
+
+# Global hotkey that toggles recording (Command+Shift+9)
+RECORDING_HOTKEY = '<cmd>+<shift>+9'
+
 class AudioProcessor:
     """Handle audio recording and processing."""
     
@@ -35,37 +73,72 @@ class AudioProcessor:
         logger.debug("Initializing AudioProcessor")
         self.app = app
         
-        # Reverting to original working audio settings
-        self.sample_rate: int = 44100
+        # Record float32 at Whisper's native rate so no resampling or conversion is needed
         self.channels: int = 1
-        self.dtype = np.int16
-        self.blocksize: int = 8192
+        self.dtype = np.float32
+        self.sample_rate: int = self._select_sample_rate()
+        self.blocksize: int = self.sample_rate // 10  # 100 ms blocks
         
         # Recording state
         self.is_recording: bool = False
         self.ready_to_record: bool = True
-        self.frames: List[np.ndarray] = []
+        self._cleaned_up = False  # Set once cleanup() has run, so atexit and stop() never clean up twice
+        
+        # Preallocated capture buffer written in place by the audio callback
+        self.max_frames: int = self.sample_rate * MAX_RECORDING_SECONDS
+        buffer_frames = self.max_frames
+        if rtmixer is not None:
+            # rtmixer writes straight into this buffer as a ring buffer, which needs a power-of-two length
+            buffer_frames = 1 << (buffer_frames - 1).bit_length()
+        self.buffer: np.ndarray = np.empty(buffer_frames, dtype=self.dtype)
+        self.write_idx: int = 0
+        self.ringbuffer = None
+        
+        # Model management. None lets ModelManager pick the tier's int8-weight compute type
+        # for this CPU; set a CTranslate2 compute type here to pin one instead
+        self.compute_type: Optional[str] = None
+        self.model_manager = ModelManager(compute_type=self.compute_type)
         
-        # Model management
-        self.model_manager = ModelManager()
+        # Decoding settings (greedy by default for low dictation latency)
+        self.beam_size: int = 1
+        self.fallback_beam_size: int = 5  # Used to re-decode low-confidence results
+        self.batch_size: int = 8
+        self.vad_options = VadOptions(min_silence_duration_ms=VAD_MIN_SILENCE_MS)
         
-        # Thread tracking
-        self.transcription_thread = None
+        # Long-lived transcription worker fed through a job queue
+        self._shutdown = Event()  # Lets in-flight transcription bail out at exit
+        self._jobs: queue.Queue = queue.Queue()
+        self.transcription_thread = Thread(target=self._transcription_worker, daemon=True)
+        self.transcription_thread.start()
         
-        # Setup keyboard listener
-        self.keys_pressed: Set = set()
-        self.listener = keyboard.Listener(
-            on_press=self.on_press,
-            on_release=self.on_release)
-        self.listener.start()
-        logger.debug("Keyboard listener started")
+        # Register the recording hotkey with the app's global listener
+        self.app.register_hotkey(RECORDING_HOTKEY, self.toggle_recording)
         
         # Register cleanup function to be called at exit
         atexit.register(self.cleanup)
         logger.debug("Registered cleanup function with atexit")
+        
+        # Warm up the model in the background so the first dictation is fast
+        self.warmup_thread = Thread(target=self.warm_up_model, daemon=True)
+        self.warmup_thread.start()
+
+    def _select_sample_rate(self) -> int:
+        """Pick the capture sample rate, preferring Whisper's native 16kHz."""
+        for sample_rate in (WHISPER_SAMPLE_RATE, FALLBACK_SAMPLE_RATE):
+            try:
+                sd.check_input_settings(
+                    samplerate=sample_rate,
+                    channels=self.channels,
+                    dtype=self.dtype
+                )
+                logger.debug(f"Using capture sample rate: {sample_rate}")
+                return sample_rate
+            except Exception as e:
+                logger.warning(f"Input device rejected {sample_rate}Hz: {e}")
+        return FALLBACK_SAMPLE_RATE
 
     def ensure_model_loaded(self) -> WhisperModel:
-        """Get a loaded model for transcription."""
+        """Get the resident model for transcription, loaded with int8 weights by default."""
         try:
             return self.model_manager.get_model()
         except Exception as e:
@@ -74,6 +147,64 @@ class AudioProcessor:
             AudioNotifier.play_sound('error')
             raise
 
+    def warm_up_model(self) -> None:
+        """Load the model and run a silent transcription to initialize VAD and tokenizer."""
+        try:
+            silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+            self.trim_silence(silence)
+            
+            # Isolated transcriptions load their own model, so there is nothing to keep warm
+            if self.model_manager.isolate_transcription:
+                return
+            
+            model = self.model_manager.get_model()
+            segments, _ = model.transcribe(silence, beam_size=1, vad_filter=False)
+            # Segments are generated lazily, so consume them to run the pipeline
+            for _ in segments:
+                pass
+            logger.debug("Model warmup completed")
+        except Exception as e:
+            logger.warning(f"Model warmup failed: {e}")
+
+    def trim_silence(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Keep only the speech regions of the audio, as detected by Silero VAD.
+        
+        Args:
+            audio: 1-D float32 audio at Whisper's sample rate
+            
+        Returns:
+            Concatenated speech regions, empty if no speech was found
+        """
+        speech_timestamps = get_speech_timestamps(audio, self.vad_options)
+        if not speech_timestamps:
+            return audio[:0]
+        
+        trimmed = np.concatenate([audio[ts["start"]:ts["end"]] for ts in speech_timestamps])
+        logger.debug(f"VAD kept {len(trimmed) / max(len(audio), 1):.0%} of the audio")
+        return trimmed
+
+    def prepare_audio_input(self, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Convert recorded audio into the float32 16kHz mono array Whisper expects.
+        
+        Args:
+            audio_data: The recorded audio samples
+            
+        Returns:
+            1-D float32 array normalized to [-1, 1] at Whisper's sample rate
+        """
+        # Capture is float32 and already normalized, so use it as is
+        audio_f32 = audio_data.reshape(-1).astype(np.float32, copy=False)
+        
+        # _select_sample_rate only returns 16kHz or the 48kHz fallback, an exact 3:1 ratio.
+        # Low-pass to remove content above 8kHz, which would otherwise alias into the speech
+        # band, then keep every third sample
+        if self.sample_rate == FALLBACK_SAMPLE_RATE and len(audio_f32) > 0:
+            audio_f32 = np.convolve(audio_f32, DECIMATION_FILTER, mode='same')[::DECIMATION_FACTOR]
+            
+        return audio_f32
+
     def transcribe_audio(self, audio_data: np.ndarray) -> Optional[str]:
         """
         Transcribe audio using Whisper.
@@ -84,86 +215,121 @@ class AudioProcessor:
         Returns:
             Transcription text or None if transcription failed
         """
+        # Keep the idle timer from unloading the model while this transcription runs
+        self.model_manager.mark_in_use()
         try:
             logger.info("Starting transcription")
             self.icon_state = "💭"  # Thinking emoji
             
-            # Get model for transcription
-            model = self.ensure_model_loaded()
+            # Get model for transcription, or a child process to run it in
+            isolated = self.model_manager.isolate_transcription
+            if isolated:
+                transcribe = self.model_manager.transcribe_isolated
+            else:
+                transcribe = self.ensure_model_loaded().transcribe
             
-            # Save temporary audio file
-            temp_file = "temp_recording.wav"
-            with wave.open(temp_file, 'wb') as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(2)
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(audio_data.tobytes())
+            # Hand the samples to Faster Whisper in memory instead of via a WAV file
+            audio_input = self.prepare_audio_input(audio_data)
             
-            # Transcribe using Faster Whisper
-            try:
-                segments, _ = model.transcribe(
-                    temp_file,
-                    beam_size=5,
-                    word_timestamps=True,
+            # Transcribe using Faster Whisper, batching VAD segments for long recordings
+            if (not isolated and
+                len(audio_input) > BATCHED_MIN_SECONDS * WHISPER_SAMPLE_RATE and
+                self.model_manager.supports_batching()):
+                logger.info("Long recording detected, using batched inference")
+                # The batched pipeline needs its own VAD pass to split the audio into batches
+                pipeline = self.model_manager.get_batched_pipeline()
+                segments, _ = pipeline.transcribe(
+                    audio_input,
+                    beam_size=self.beam_size,
+                    batch_size=self.batch_size,
                     vad_filter=True,
-                    vad_parameters=dict(min_silence_duration_ms=500)
+                    vad_parameters=dict(min_silence_duration_ms=VAD_MIN_SILENCE_MS)
                 )
-                
-                # Process segments
-                text_segments = []
-                for segment in segments:
-                    # Clean up the segment text
-                    segment_text = segment.text.strip()
-                    if segment_text:
-                        text_segments.append(segment_text)
-                
-                # Join and process the text
-                if text_segments:
-                    text = ' '.join(text_segments)
-                    processed_text = process_text(text)
-                    logger.info(f"Transcription successful: {processed_text}")
-                    
-                    # Check if we should unload the model
-                    self.model_manager.check_timeout()
-                    
-                    return processed_text
-                else:
+                result = self.collect_segment_text(segments)
+            else:
+                # Cut out silence ourselves so the model only encodes speech
+                audio_input = self.trim_silence(audio_input)
+                if len(audio_input) == 0:
                     logger.warning("No speech detected in audio")
                     return None
                     
-            finally:
-                # Ensure temporary file is always cleaned up
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
+                segments, _ = transcribe(
+                    audio_input,
+                    beam_size=self.beam_size,
+                    vad_filter=False
+                )
+                result = self.collect_segment_text(segments)
+                
+                # Re-decode with beam search if greedy decoding was unsure of the result
+                if (result and result[0] and
+                    self.beam_size < self.fallback_beam_size and
+                    result[1] < LOW_CONFIDENCE_LOGPROB):
+                    logger.info(f"Low confidence transcription (avg logprob {result[1]:.2f}), retrying with beam search")
+                    segments, _ = transcribe(
+                        audio_input,
+                        beam_size=self.fallback_beam_size,
+                        vad_filter=False
+                    )
+                    result = self.collect_segment_text(segments)
+            
+            # Transcription was abandoned because the app is shutting down
+            if result is None:
+                return None
+            text_segments, _ = result
+            
+            # Join and process the text
+            if text_segments:
+                text = ' '.join(text_segments)
+                processed_text = process_text(text)
+                logger.info(f"Transcription successful: {processed_text}")
+                return processed_text
+            else:
+                logger.warning("No speech detected in audio")
+                return None
                     
         except Exception as e:
             logger.error(f"Error during transcription: {e}")
             return None
         finally:
+            self.model_manager.mark_idle()
             self.icon_state = "🎤"  # Reset icon
 
-    def on_press(self, key: keyboard.Key) -> None:
-        """Handle key press events."""
-        try:
-            # Add the key to the set of pressed keys
-            self.keys_pressed.add(key)
+    def collect_segment_text(self, segments: Iterable) -> Optional[Tuple[List[str], float]]:
+        """
+        Gather segment text, streaming partial text to the clipboard as it arrives.
+        
+        Args:
+            segments: Segments generated by the model
             
-            # Check for Command+Shift+9 combination
-            if (keyboard.Key.cmd in self.keys_pressed and 
-                keyboard.Key.shift in self.keys_pressed and 
-                hasattr(key, 'char') and key.char == '9'):
-                # Toggle recording
-                self.toggle_recording()
-        except Exception as e:
-            logger.error(f"Error in key press handler: {e}")
-
-    def on_release(self, key: keyboard.Key) -> None:
-        """Handle key release events."""
-        try:
-            # Remove the key from the set of pressed keys if it's there
-            self.keys_pressed.discard(key)
-        except Exception as e:
-            logger.error(f"Error in key release handler: {e}")
+        Returns:
+            Tuple of (texts, avg_logprob), or None if the app is shutting down
+            - texts: Non-empty segment texts in order
+            - avg_logprob: Mean log probability of the segments (0.0 if unavailable)
+        """
+        text_segments = []
+        logprobs = []
+        last_clipboard_update = time.monotonic()
+        for segment in segments:
+            # Stop early if the app is shutting down
+            if self._shutdown.is_set():
+                logger.info("Shutdown requested, abandoning transcription")
+                return None
+            
+            # Clean up the segment text
+            segment_text = segment.text.strip()
+            if segment_text:
+                text_segments.append(segment_text)
+                logprobs.append(getattr(segment, 'avg_logprob', 0.0))
+                
+                # Throttle clipboard updates; the final text is copied once processed
+                now = time.monotonic()
+                if now - last_clipboard_update >= CLIPBOARD_UPDATE_INTERVAL:
+                    pyperclip.copy(' '.join(text_segments))
+                    last_clipboard_update = now
+                    logger.debug(f"Copied {len(text_segments)} partial segments to clipboard")
+        
+        avg_logprob = sum(logprobs) / len(logprobs) if logprobs else 0.0
+        return text_segments, avg_logprob
 
     def toggle_recording(self) -> None:
         """Toggle recording state."""
@@ -181,34 +347,62 @@ class AudioProcessor:
         try:
             logger.info("Starting recording")
             self.ready_to_record = False  # Prevent multiple starts
-            self.frames = []  # Clear previous frames
+            self.write_idx = 0  # Clear previous recording
             self.is_recording = True
             
             # Update app state
             self.app.set_state('recording')
             
+            # Move existing objects out of the collector's reach so collections during recording
+            # only scan new allocations and stay short. The GC itself stays enabled, so the
+            # transcription worker can still reclaim cycles while a recording runs
+            gc.freeze()
+            
             # Start recording stream
-            self.stream = sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype=self.dtype,
-                blocksize=self.blocksize,
-                callback=self.callback
-            )
-            self.stream.start()
+            if rtmixer is not None:
+                # PortAudio fills the capture buffer from C; it is never read until the
+                # recording stops, so the samples stay contiguous from the start
+                self.ringbuffer = rtmixer.RingBuffer(self.buffer.itemsize * self.channels, buffer=self.buffer)
+                self.stream = rtmixer.Recorder(
+                    samplerate=self.sample_rate,
+                    channels=self.channels,
+                    blocksize=self.blocksize
+                )
+                self.stream.start()
+                self.stream.record_ringbuffer(self.ringbuffer)
+            else:
+                self.stream = sd.InputStream(
+                    samplerate=self.sample_rate,
+                    channels=self.channels,
+                    dtype=self.dtype,
+                    blocksize=self.blocksize,
+                    callback=self.callback
+                )
+                self.stream.start()
             
         except Exception as e:
             logger.error(f"Error starting recording: {e}")
             self.is_recording = False
+            gc.unfreeze()
             AudioNotifier.play_sound('error')
         finally:
             self.ready_to_record = True  # Ready for next recording
 
     def callback(self, indata: np.ndarray, frames: int, time_info: dict, status: sd.CallbackFlags) -> None:
-        """Callback for audio stream to collect frames."""
+        """Callback for audio stream to write frames into the capture buffer."""
         if status:
             logger.warning(f"Audio callback status: {status}")
-        self.frames.append(indata.copy())
+        
+        # Stop capturing once the buffer is full rather than growing it here
+        available = len(self.buffer) - self.write_idx
+        if frames > available:
+            self.buffer[self.write_idx:] = indata[:available, 0]
+            self.write_idx = len(self.buffer)
+            logger.warning("Maximum recording length reached, capture stopped")
+            raise sd.CallbackStop
+        
+        self.buffer[self.write_idx:self.write_idx + frames] = indata[:, 0]
+        self.write_idx += frames
 
     def stop_recording(self) -> None:
         """Stop recording and process the audio."""
@@ -230,66 +424,79 @@ class AudioProcessor:
             if hasattr(self, 'stream'):
                 self.stream.stop()
                 self.stream.close()
+            gc.unfreeze()
+            
+            # With rtmixer, everything written to the ring buffer is the recording. The ring
+            # buffer is padded to a power of two, so apply the same length cap as the callback
+            if self.ringbuffer is not None:
+                self.write_idx = self.ringbuffer.read_available
+                self.ringbuffer = None
+                if self.write_idx >= self.max_frames:
+                    self.write_idx = self.max_frames
+                    logger.warning("Maximum recording length reached, capture stopped")
             
             # Process the recorded audio if we have frames
-            if self.frames:
-                # Convert frames to a single array
-                audio_data = np.concatenate(self.frames, axis=0)
+            if self.write_idx:
+                # Copy out of the shared buffer so the next recording can't overwrite it
+                audio_data = self.buffer[:self.write_idx].copy()
                 
-                # Start transcription in a separate thread to keep UI responsive
-                def transcribe_thread():
-                    try:
-                        # Transcribe the audio
-                        logger.info("Starting transcription")
-                        transcription = self.transcribe_audio(audio_data)
-                        
-                        if transcription:
-                            # Copy to clipboard
-                            pyperclip.copy(transcription)
-                            logger.info(f"Transcription successful: {transcription}")
-                            logger.info("Transcription copied to clipboard")
-                            
-                            # Set completed state
-                            self.app.set_state('completed')
-                        else:
-                            logger.warning("No transcription result")
-                            AudioNotifier.play_sound('error')
-                            self.app.set_state('idle')
-                    except Exception as e:
-                        logger.error(f"Error in transcription thread: {e}")
-                        AudioNotifier.play_sound('error')
-                        self.app.set_state('idle')
-                
-                # Start the transcription thread and track it
-                self.transcription_thread = Thread(target=transcribe_thread)
-                self.transcription_thread.daemon = True  # Make it a daemon thread
-                self.transcription_thread.start()
-                logger.debug("Transcription thread started")
+                # Hand the audio to the transcription worker to keep UI responsive
+                self._jobs.put(audio_data)
+                logger.debug("Transcription job queued")
             else:
                 logger.warning("No audio frames captured")
                 self.app.set_state('idle')
                 
         except Exception as e:
             logger.error(f"Error stopping recording: {e}")
+            gc.unfreeze()
+            AudioNotifier.play_sound('error')
+            self.app.set_state('idle')
+
+    def _transcription_worker(self) -> None:
+        """Transcribe queued recordings one at a time until shutdown."""
+        while not self._shutdown.is_set():
+            audio_data = self._jobs.get()
+            if audio_data is None:  # Shutdown sentinel
+                break
+            self._run_transcription(audio_data)
+
+    def _run_transcription(self, audio_data: np.ndarray) -> None:
+        """Transcribe a recording and copy the result to the clipboard."""
+        try:
+            # Transcribe the audio
+            logger.info("Starting transcription")
+            transcription = self.transcribe_audio(audio_data)
+            
+            if transcription:
+                # Copy to clipboard
+                pyperclip.copy(transcription)
+                logger.info(f"Transcription successful: {transcription}")
+                logger.info("Transcription copied to clipboard")
+                
+                # Set completed state
+                self.app.set_state('completed')
+            else:
+                logger.warning("No transcription result")
+                AudioNotifier.play_sound('error')
+                self.app.set_state('idle')
+        except Exception as e:
+            logger.error(f"Error in transcription thread: {e}")
             AudioNotifier.play_sound('error')
             self.app.set_state('idle')
 
     def save_audio(self, filename: str) -> Optional[np.ndarray]:
         """Save recorded audio to a WAV file."""
-        if not self.frames:
+        if not self.write_idx:
             logger.warning("No audio frames to save")
             return None
             
         try:
-            # Combine all frames
-            audio_data = np.concatenate(self.frames, axis=0)
+            # Recorded samples are already contiguous in the buffer
+            audio_data = self.buffer[:self.write_idx]
             
-            # Save to WAV file
-            with wave.open(filename, 'wb') as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(2)  # 16-bit audio
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(audio_data.tobytes())
+            # Save to WAV file (soundfile converts the float32 samples to 16-bit PCM on write)
+            sf.write(filename, audio_data, self.sample_rate, subtype='PCM_16')
                 
             logger.info(f"Audio saved to {filename}")
             return audio_data
@@ -298,33 +505,26 @@ class AudioProcessor:
             return None
 
     def cleanup(self):
-        """Clean up resources when the application exits."""
+        """Clean up resources when the application exits. Safe to call more than once."""
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
         logger.info("Cleaning up AudioProcessor resources")
         
-        # Stop keyboard listener if active
-        if hasattr(self, 'listener') and self.listener:
-            logger.info("Stopping keyboard listener")
-            self.listener.stop()
-        
-        # Stop audio stream if active
+        # Abort audio stream if active, discarding any pending buffers
         if hasattr(self, 'stream') and self.stream and self.stream.active:
-            logger.info("Stopping audio stream")
-            self.stream.stop()
+            logger.info("Aborting audio stream")
+            self.stream.abort()
             self.stream.close()
         
-        # Stop transcription thread if active
-        if hasattr(self, 'transcription_thread') and self.transcription_thread and self.transcription_thread.is_alive():
-            logger.info("Waiting for transcription thread to complete")
-            # Give the thread a chance to complete naturally
-            self.transcription_thread.join(timeout=2.0)
+        # Signal the transcription thread to stop; it is a daemon so we don't wait for it
+        if hasattr(self, '_shutdown'):
+            self._shutdown.set()
+            self._jobs.put(None)  # Wake the worker if it is waiting for a job
         
         # Unload model if loaded
         if hasattr(self, 'model_manager') and self.model_manager:
             logger.info("Unloading Whisper model")
             self.model_manager.unload_model()
         
-        # Force garbage collection
-        logger.info("Forcing garbage collection")
-        gc.collect()
-        
         logger.info("AudioProcessor cleanup completed") 
\ No newline at end of file
@@ -1,20 +1,99 @@
 #app/models/model_manager.py
 
 import os
+import json
 import logging
 import shutil
+import subprocess
 import psutil
 import platform
 from pathlib import Path
 from typing import Optional, Callable, Dict
-from faster_whisper import WhisperModel
+from collections import deque
+
+# orjson is optional; the stdlib json module is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def get_performance_core_count() -> int:
+    """Get the number of performance cores, falling back to physical cores."""
+    if platform.system() == "Darwin":
+        try:
+            output = subprocess.check_output(
+                ["sysctl", "-n", "hw.perflevel0.physicalcpu"],
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+            return int(output.strip())
+        except (subprocess.SubprocessError, OSError, ValueError):
+            pass
+    return psutil.cpu_count(logical=False) or os.cpu_count() or 1
+
+def detect_apple_silicon() -> bool:
+    """Check if the host is Apple Silicon, including x86_64 Python running under Rosetta."""
+    if platform.system() != "Darwin":
+        return False
+    if platform.machine() == "arm64":
+        return True
+    try:
+        output = subprocess.check_output(
+            ["sysctl", "-n", "sysctl.proc_translated"],
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        return output.strip() == "1"
+    except (subprocess.SubprocessError, OSError):
+        return False
+
+# Thread settings must be in the environment before CTranslate2 is imported. Modules that
+# use faster_whisper import this module first; setdefault keeps any value the user exported
+PERFORMANCE_CORES = get_performance_core_count()
+os.environ.setdefault("OMP_NUM_THREADS", str(PERFORMANCE_CORES))
+os.environ.setdefault("MKL_NUM_THREADS", str(PERFORMANCE_CORES))
+os.environ.setdefault("CT2_USE_EXPERIMENTAL_PACKED_GEMM", "1")
+
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+from faster_whisper.utils import download_model as fetch_model_files
+import ctranslate2
+from app.models.whisper_cpp_model import WhisperCppModel, is_whisper_cpp_available
 import time
 import gc
+import threading
 import multiprocessing
+import queue
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Number of recent samples kept per performance statistic
+PERFORMANCE_HISTORY_SIZE = 256
+
+# Seconds between liveness checks while waiting on an isolated transcription process
+ISOLATED_POLL_INTERVAL = 1.0
+
+# Seconds to reuse memory and disk readings before querying psutil again
+SYSTEM_STATUS_TTL = 1.0
+
+# Compute types CTranslate2 supports on this CPU, probed once at import
+SUPPORTED_CPU_COMPUTE_TYPES = frozenset(ctranslate2.get_supported_compute_types("cpu"))
+
+def _isolated_transcription_worker(model_name: str, settings: Dict, audio, options: Dict, result_queue) -> None:
+    """Load a model and transcribe in a child process, sending the segments back through result_queue."""
+    try:
+        model = WhisperModel(
+            model_name,
+            device="cpu",
+            compute_type=settings["compute_type"],
+            cpu_threads=settings.get("cpu_threads", 4),
+            num_workers=settings.get("num_workers", 1)
+        )
+        segments, _ = model.transcribe(audio, **options)
+        result_queue.put((True, list(segments)))
+    except Exception as e:
+        result_queue.put((False, str(e)))
+
 class ModelManager:
     """Manages Whisper model files and configuration."""
     
@@ -80,14 +159,20 @@ class ModelManager:
             "optimal_settings": {
                 "cpu_threads": 4,
                 "num_workers": 1,
-                "compute_type": "int8",
+                "compute_type": "int8_bfloat16",
                 "memory_threshold": 0.8  # 80% memory threshold
             }
         }
     }
     
-    def __init__(self):
-        """Initialize the ModelManager."""
+    def __init__(self, compute_type: Optional[str] = None):
+        """
+        Initialize the ModelManager.
+        
+        Args:
+            compute_type: CTranslate2 compute type to load models with, or None
+                to pick one based on the detected hardware
+        """
         # Set up application directories
         self.app_support_dir = Path.home() / "Library" / "Application Support" / self.APP_NAME
         self.config_dir = self.app_support_dir / "config"
@@ -100,23 +185,57 @@ class ModelManager:
         self.system_info = self.get_system_info()
         logger.info(f"System capabilities detected: {self.system_info}")
         
+        # Per-model loading settings, sized for this host
+        self.model_settings = self._specialize_model_settings()
+        
         # Performance monitoring
+        self._proc = psutil.Process()
+        # Bounded history with running sums so summaries stay O(1) in a long-lived app
         self.performance_stats = {
-            "load_times": [],
-            "memory_usage": [],
-            "cpu_usage": []
+            "load_times": deque(maxlen=PERFORMANCE_HISTORY_SIZE),
+            "memory_usage": deque(maxlen=PERFORMANCE_HISTORY_SIZE),
+            "cpu_usage": deque(maxlen=PERFORMANCE_HISTORY_SIZE)
         }
+        self._perf_sums = {key: 0.0 for key in self.performance_stats}
         
         # Model state management
+        self.compute_type = compute_type
+        self._compute_type_cache: Dict[str, str] = {}  # Results of test_compute_type_support
         self.model = None
+        self.batched_pipeline = None
+        self._model_lock = threading.Lock()  # Serializes loads from warmup and transcription threads
         self.last_use_time = None
         self.model_timeout = 300  # 5 minutes
+        self._timeout_timer: Optional[threading.Timer] = None  # Unloads the model once idle
+        self._active_uses = 0  # Transcriptions currently using the model; never unload while > 0
+        
+        # Cached check_model_location results: model -> (cache_dir mtime, exists, location)
+        self._location_cache: Dict[str, tuple] = {}
+        # Resolved snapshot directories, reused while their model.bin is still present
+        self._snapshot_path_cache: Dict[str, Path] = {}
+        
+        # Short-lived (timestamp, reading) caches for psutil memory and disk queries
+        self._mem_cache: Optional[tuple] = None
+        self._disk_cache: Optional[tuple] = None
         
         # Ensure directories exist
         self._setup_directories()
         
         # Load or initialize current model
-        self.current_model = self._load_config().get('current_model', None)
+        config = self._load_config()
+        self.current_model = config.get('current_model', None)
+        
+        # Run each transcription in a short-lived process so native allocations are returned to the OS
+        self.isolate_transcription = bool(config.get('isolate_transcription', False))
+        
+        # Inference backend: whisper.cpp (Core ML/Metal) on Apple Silicon, only when enabled and installed
+        if (config.get('use_whisper_cpp', False) and
+            self.system_info.get("is_apple_silicon", False) and
+            is_whisper_cpp_available()):
+            self.backend = "whisper.cpp"
+        else:
+            self.backend = "faster-whisper"
+        logger.info(f"Using inference backend: {self.backend}")
         
         logger.debug(f"ModelManager initialized with current model: {self.current_model}")
         
@@ -141,9 +260,8 @@ class ModelManager:
         """Load configuration from file."""
         if self.config_file.exists():
             try:
-                import json
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                data = self.config_file.read_bytes()
+                return orjson.loads(data) if orjson else json.loads(data)
             except Exception as e:
                 logger.error(f"Error loading config: {e}")
         return {}
@@ -151,9 +269,11 @@ class ModelManager:
     def _save_config(self, config: dict) -> None:
         """Save configuration to file."""
         try:
-            import json
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f)
+            data = orjson.dumps(config) if orjson else json.dumps(config).encode()
+            # Write to a temporary file and rename so a crash never leaves a torn config
+            tmp_file = self.config_file.with_suffix(".tmp")
+            tmp_file.write_bytes(data)
+            tmp_file.replace(self.config_file)
         except Exception as e:
             logger.error(f"Error saving config: {e}")
             
@@ -169,28 +289,16 @@ class ModelManager:
         if model_name not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model name: {model_name}")
             
-        # Check for model files in any snapshot directory
-        model_dir = self.get_model_location(model_name)
-        if not model_dir.exists():
-            return False
-            
-        # Look for model files in snapshot directories
-        for snapshot_dir in (model_dir / "snapshots").glob("*"):
-            if (snapshot_dir / "model.bin").exists():
-                return True
-        
-        return False
+        return self.check_model_location(model_name)[0]
     
     def get_model_path(self) -> Path:
         """Get the path where current model files are stored."""
         if self.current_model is None:
             raise ValueError("No model currently selected")
             
-        model_dir = self.get_model_location(self.current_model)
-        # Find the first snapshot directory containing model.bin
-        for snapshot_dir in (model_dir / "snapshots").glob("*"):
-            if (snapshot_dir / "model.bin").exists():
-                return snapshot_dir
+        exists, location = self.check_model_location(self.current_model)
+        if exists:
+            return location
         
         raise FileNotFoundError(f"Model files not found for {self.current_model}")
     
@@ -202,18 +310,19 @@ class ModelManager:
         try:
             logger.info(f"Starting download of model: {model_name}")
             
-            # This will automatically download the model to cache
-            model = WhisperModel(model_name, download_root=str(self.cache_dir))
+            # Fetch the model files into the cache without loading the weights into memory;
+            # huggingface_hub downloads the files concurrently
+            fetch_model_files(model_name, cache_dir=str(self.cache_dir))
+            
+            # The download changes the model directory, so forget any cached location
+            self._location_cache.pop(model_name, None)
+            self._snapshot_path_cache.pop(model_name, None)
             
-            # Give a longer delay for filesystem to update and verify
-            import time
-            attempts = 0
-            while attempts < 5:  # Try for up to 5 seconds
-                time.sleep(1)
-                if self.check_model_exists(model_name):
-                    logger.info(f"Model {model_name} successfully downloaded")
-                    return True, "Model downloaded successfully"
-                attempts += 1
+            # fetch_model_files (snapshot_download) returns only after the files are written, so one check is enough
+            exists, _ = self.check_model_location(model_name)
+            if exists:
+                logger.info(f"Model {model_name} successfully downloaded")
+                return True, "Model downloaded successfully"
             
             logger.error("Model download completed but model not found in expected location")
             return False, "Model download failed: Model not found after download"
@@ -225,18 +334,24 @@ class ModelManager:
     def get_model_size_on_disk(self, model_name: str) -> Optional[int]:
         """Get the actual size of a downloaded model in bytes."""
         try:
-            import glob
-            total_size = 0
             model_path = self.get_model_location(model_name)
             if model_path.exists():
-                for path in model_path.rglob('*'):
-                    if path.is_file():
-                        total_size += path.stat().st_size
-                return total_size
+                return self._directory_size(str(model_path))
         except Exception as e:
             logger.error(f"Error calculating model size: {e}")
         return None
     
+    def _directory_size(self, path: str) -> int:
+        """Sum file sizes under a directory using cached scandir entry metadata."""
+        total_size = 0
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total_size += self._directory_size(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
+        return total_size
+    
     def get_available_models(self) -> dict:
         """Get information about all available models."""
         return self.AVAILABLE_MODELS
@@ -274,7 +389,7 @@ class ModelManager:
         try:
             model_size = self.AVAILABLE_MODELS[model_name]["size_mb"] * 1024 * 1024  # Convert MB to bytes
             # Get free space in cache directory
-            free_space = psutil.disk_usage(self.cache_dir).free
+            free_space = self._disk_usage().free
             
             # Add 20% buffer for safety
             required_space = model_size * 1.2
@@ -288,6 +403,44 @@ class ModelManager:
             logger.error(f"Error checking disk space: {e}")
             return False, f"Error checking disk space: {e}" 
     
+    def probe_model(self, model_name: str) -> tuple[bool, bool, str]:
+        """
+        Check in one call whether a model is downloaded and, if not, whether it fits on disk.
+        
+        Args:
+            model_name: Name of the model to check
+            
+        Returns:
+            Tuple of (exists: bool, has_space: bool, message: str)
+            - exists: True if the model is already downloaded
+            - has_space: True if the model exists or there is room to download it
+            - message: Disk space message, empty if the model exists
+        """
+        exists, _ = self.check_model_location(model_name)
+        if exists:
+            # No download needed, so skip the disk query
+            return True, True, ""
+        has_space, message = self.check_disk_space(model_name)
+        return False, has_space, message
+    
+    def _virtual_memory(self):
+        """Get psutil.virtual_memory(), reusing a reading taken within SYSTEM_STATUS_TTL."""
+        now = time.monotonic()
+        if self._mem_cache and now - self._mem_cache[0] < SYSTEM_STATUS_TTL:
+            return self._mem_cache[1]
+        memory = psutil.virtual_memory()
+        self._mem_cache = (now, memory)
+        return memory
+    
+    def _disk_usage(self):
+        """Get psutil.disk_usage() for the cache directory, reusing a recent reading."""
+        now = time.monotonic()
+        if self._disk_cache and now - self._disk_cache[0] < SYSTEM_STATUS_TTL:
+            return self._disk_cache[1]
+        usage = psutil.disk_usage(str(self.cache_dir))
+        self._disk_cache = (now, usage)
+        return usage
+    
     def check_model_location(self, model_name: str) -> tuple[bool, Optional[Path]]:
         """
         Check if a model exists and return its location.
@@ -309,6 +462,31 @@ class ModelManager:
             logger.debug(f"Invalid model name: {model_name}")
             return False, None
         
+        # A previously resolved snapshot stays valid as long as its weights exist
+        snapshot_dir = self._snapshot_path_cache.get(model_name)
+        if snapshot_dir is not None:
+            if (snapshot_dir / "model.bin").exists():
+                return True, snapshot_dir
+            del self._snapshot_path_cache[model_name]
+            self._location_cache.pop(model_name, None)
+        
+        # Reuse the cached result while the cache directory is unchanged
+        try:
+            cache_mtime = self.cache_dir.stat().st_mtime_ns
+        except OSError:
+            cache_mtime = None
+        cached = self._location_cache.get(model_name)
+        if cached and cache_mtime is not None and cached[0] == cache_mtime:
+            return cached[1], cached[2]
+            
+        exists, location = self._find_model_location(model_name)
+        self._location_cache[model_name] = (cache_mtime, exists, location)
+        if exists:
+            self._snapshot_path_cache[model_name] = location
+        return exists, location
+    
+    def _find_model_location(self, model_name: str) -> tuple[bool, Optional[Path]]:
+        """Search the model's cache directory for a snapshot containing model.bin."""
         # Get model directory
         model_dir = self.get_model_location(model_name)
         if not model_dir.exists():
@@ -330,6 +508,30 @@ class ModelManager:
         logger.debug(f"No model.bin found in snapshots: {snapshots_dir}")
         return False, None
     
+    def _specialize_model_settings(self) -> Dict[str, Dict]:
+        """
+        Adapt each model's optimal settings to the detected hardware.
+        
+        Returns:
+            Dict mapping model name to a copy of its optimal settings, with
+            cpu_threads sized for this host
+        """
+        cpu_cores = self.system_info.get("cpu_cores") or 2
+        performance_cores = self.system_info.get("performance_cores") or cpu_cores
+        # Leave a core free for audio capture and the UI
+        thread_limit = min(max(1, cpu_cores - 1), performance_cores)
+        
+        model_settings = {}
+        for name, info in self.AVAILABLE_MODELS.items():
+            settings = dict(info["optimal_settings"])
+            if name == "large":
+                # CTranslate2 stops scaling well past 8 threads
+                settings["cpu_threads"] = min(performance_cores, 8)
+            else:
+                settings["cpu_threads"] = min(settings["cpu_threads"], thread_limit)
+            model_settings[name] = settings
+        return model_settings
+    
     def check_memory_status(self) -> tuple[bool, float]:
         """
         Check current memory status.
@@ -340,7 +542,7 @@ class ModelManager:
             - memory_usage: Current memory usage as a percentage
         """
         try:
-            memory = psutil.virtual_memory()
+            memory = self._virtual_memory()
             memory_usage = memory.percent / 100.0  # Convert to decimal
             
             logger.debug(f"Current memory usage: {memory_usage:.1%}")
@@ -350,32 +552,41 @@ class ModelManager:
             logger.warning(f"Error checking memory status: {e}")
             return False, 0.0
 
-    def test_compute_type_support(self) -> str:
+    def test_compute_type_support(self, model_name: Optional[str] = None) -> str:
         """
         Test which compute types are supported by the system.
-        Returns the most efficient supported compute type.
+        Returns the preferred compute type for the model's tier if the CPU supports it,
+        otherwise int8. Results are cached per model after the first call.
         """
+        model_name = model_name or self.current_model
+        if model_name in self._compute_type_cache:
+            return self._compute_type_cache[model_name]
+            
         try:
-            # First try to detect Apple Silicon, which doesn't support float16
+            # Apple Silicon runs int8 on the NEON dot-product path
             if self.system_info.get("is_apple_silicon", False):
                 logger.info("Apple Silicon detected, using int8 compute type")
-                return "int8"
-
-            # For other systems, try float16 without loading a model
-            import ctypes
-            try:
-                # Try to create a float16 array using numpy
-                import numpy as np
-                test_array = np.zeros(1, dtype=np.float16)
-                logger.info("float16 compute type is supported")
-                return "float16"
-            except Exception:
-                logger.info("float16 not supported, falling back to int8")
-                return "int8"
+                compute_type = "int8"
+            else:
+                preferred = self.AVAILABLE_MODELS[model_name]["optimal_settings"]["compute_type"]
                 
+                # bfloat16 activations only pay off when there's memory to spare
+                if preferred == "int8_bfloat16" and self.system_info["memory_gb"] < 8:
+                    preferred = "int8"
+                    
+                if preferred in SUPPORTED_CPU_COMPUTE_TYPES:
+                    compute_type = preferred
+                else:
+                    logger.info(f"{preferred} not supported, falling back to int8")
+                    compute_type = "int8"
+                    
         except Exception as e:
             logger.warning(f"Unexpected error testing compute type: {e}")
-            return "int8"  # Default to int8 as safest option
+            compute_type = "int8"  # Default to int8 as safest option
+            
+        logger.info(f"Using {compute_type} compute type for {model_name}")
+        self._compute_type_cache[model_name] = compute_type
+        return compute_type
 
     def get_optimal_settings(self, model_name: str = None) -> Dict:
         """
@@ -393,15 +604,14 @@ class ModelManager:
             if not model_name:
                 raise ValueError("No model specified")
 
-            # Get model info and optimal settings
-            model_info = self.AVAILABLE_MODELS[model_name]
-            optimal_settings = model_info["optimal_settings"]
+            # Get the host-specialized optimal settings
+            optimal_settings = self.model_settings[model_name]
             
             # Check memory status
             memory_ok, memory_usage = self.check_memory_status()
             
-            # Test supported compute type
-            compute_type = self.test_compute_type_support()
+            # Use the configured compute type, or test which one is supported
+            compute_type = self.compute_type or self.test_compute_type_support(model_name)
             
             # Base settings with optimal values
             settings = {
@@ -435,47 +645,6 @@ class ModelManager:
                 "num_workers": 1
             }
 
-    def monitor_performance(self, operation: str):
-        """
-        Decorator to monitor performance of model operations.
-        
-        Args:
-            operation: Name of the operation being monitored
-        """
-        def decorator(func):
-            def wrapper(*args, **kwargs):
-                start_time = time.time()
-                start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-                start_cpu = psutil.cpu_percent()
-                
-                try:
-                    result = func(*args, **kwargs)
-                    
-                    # Calculate metrics
-                    end_time = time.time()
-                    end_memory = psutil.Process().memory_info().rss / 1024 / 1024
-                    end_cpu = psutil.cpu_percent()
-                    
-                    # Store performance data
-                    self.performance_stats["load_times"].append(end_time - start_time)
-                    self.performance_stats["memory_usage"].append(end_memory - start_memory)
-                    self.performance_stats["cpu_usage"].append(end_cpu - start_cpu)
-                    
-                    # Log performance data
-                    logger.info(f"Performance stats for {operation}:")
-                    logger.info(f"  Time taken: {end_time - start_time:.2f} seconds")
-                    logger.info(f"  Memory change: {end_memory - start_memory:.1f} MB")
-                    logger.info(f"  CPU usage: {end_cpu - start_cpu:.1f}%")
-                    
-                    return result
-                    
-                except Exception as e:
-                    logger.error(f"Error during {operation}: {e}")
-                    raise
-                    
-            return wrapper
-        return decorator
-
     @staticmethod
     def performance_monitor(operation: str):
         """
@@ -486,28 +655,28 @@ class ModelManager:
         """
         def decorator(func):
             def wrapper(self, *args, **kwargs):
-                start_time = time.time()
-                start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-                start_cpu = psutil.cpu_percent()
+                start_time = time.perf_counter()
+                start_memory = self._proc.memory_info().rss / 1024 / 1024  # MB
+                start_cpu = time.process_time()
                 
                 try:
                     result = func(self, *args, **kwargs)
                     
                     # Calculate metrics
-                    end_time = time.time()
-                    end_memory = psutil.Process().memory_info().rss / 1024 / 1024
-                    end_cpu = psutil.cpu_percent()
+                    end_time = time.perf_counter()
+                    end_memory = self._proc.memory_info().rss / 1024 / 1024
+                    end_cpu = time.process_time()
                     
                     # Store performance data
-                    self.performance_stats["load_times"].append(end_time - start_time)
-                    self.performance_stats["memory_usage"].append(end_memory - start_memory)
-                    self.performance_stats["cpu_usage"].append(end_cpu - start_cpu)
+                    self._record_performance_stat("load_times", end_time - start_time)
+                    self._record_performance_stat("memory_usage", end_memory - start_memory)
+                    self._record_performance_stat("cpu_usage", end_cpu - start_cpu)
                     
                     # Log performance data
                     logger.info(f"Performance stats for {operation}:")
                     logger.info(f"  Time taken: {end_time - start_time:.2f} seconds")
                     logger.info(f"  Memory change: {end_memory - start_memory:.1f} MB")
-                    logger.info(f"  CPU usage: {end_cpu - start_cpu:.1f}%")
+                    logger.info(f"  CPU time: {end_cpu - start_cpu:.2f} seconds")
                     
                     return result
                     
@@ -522,74 +691,169 @@ class ModelManager:
     def get_model(self) -> WhisperModel:
         """Get the Whisper model instance, loading it if necessary."""
         try:
-            if self.model is None:
-                if not self.current_model:
-                    raise ValueError("No model currently selected")
+            with self._model_lock:
+                if self.model is None:
+                    if not self.current_model:
+                        raise ValueError("No model currently selected")
+                        
+                    logger.info("Loading Whisper model from cache...")
+                    settings = self.get_optimal_settings()
+                    logger.info(f"Using settings for {self.current_model}: {settings}")
                     
-                logger.info("Loading Whisper model from cache...")
-                settings = self.get_optimal_settings()
-                logger.info(f"Using settings for {self.current_model}: {settings}")
-                
-                self.model = WhisperModel(
-                    self.current_model,
-                    device="cpu",
-                    compute_type=settings["compute_type"],  # Use dynamically determined compute type
-                    cpu_threads=settings.get("cpu_threads", 4),
-                    num_workers=settings.get("num_workers", 1)
-                )
-                self.last_use_time = time.time()
-            return self.model
+                    if self.backend == "whisper.cpp":
+                        try:
+                            self.model = WhisperCppModel(
+                                self.current_model,
+                                cpu_threads=settings.get("cpu_threads", 4)
+                            )
+                            logger.info("whisper.cpp segments carry no log probabilities, so the low-confidence beam search retry is unavailable")
+                        except Exception as e:
+                            # Fall back to CTranslate2 on CPU if the accelerated backend can't load
+                            logger.warning(f"whisper.cpp backend failed to load, falling back to faster-whisper: {e}")
+                            self.backend = "faster-whisper"
+                    
+                    if self.backend == "faster-whisper":
+                        self.model = WhisperModel(
+                            self.current_model,
+                            device="cpu",
+                            compute_type=settings["compute_type"],  # Use dynamically determined compute type
+                            cpu_threads=settings.get("cpu_threads", 4),
+                            num_workers=settings.get("num_workers", 1)
+                        )
+                # Restart the idle countdown on every access
+                self.last_use_time = time.monotonic()
+                self._schedule_timeout()
+                return self.model
         except Exception as e:
             logger.error(f"Error loading model {self.current_model}: {str(e)}")
             logger.error(f"Error during model_loading: {str(e)}")
             raise
 
+    def transcribe_isolated(self, audio, **kwargs) -> tuple:
+        """
+        Transcribe in a separate process that exits afterwards.
+        
+        CTranslate2 can hold on to memory after a transcription even once the model is
+        unloaded; ending the process is the only reliable way to give it back.
+        
+        Args:
+            audio: Path to an audio file, or a 1-D float32 array at 16kHz
+            **kwargs: Options passed to WhisperModel.transcribe
+            
+        Returns:
+            Tuple of (segments, None), matching the shape of WhisperModel.transcribe
+        """
+        if not self.current_model:
+            raise ValueError("No model currently selected")
+            
+        settings = self.get_optimal_settings()
+        # Spawn rather than fork; forking a process with running threads is unsafe on macOS
+        context = multiprocessing.get_context("spawn")
+        result_queue = context.Queue()
+        process = context.Process(
+            target=_isolated_transcription_worker,
+            args=(self.current_model, settings, audio, kwargs, result_queue),
+            daemon=True
+        )
+        process.start()
+        try:
+            # Read before joining so a large result can't block the child on a full pipe.
+            # Poll so a child that dies without replying (OOM kill, native crash) can't hang us
+            while True:
+                try:
+                    success, result = result_queue.get(timeout=ISOLATED_POLL_INTERVAL)
+                    break
+                except queue.Empty:
+                    if not process.is_alive():
+                        # The child may have replied just before exiting
+                        try:
+                            success, result = result_queue.get(timeout=ISOLATED_POLL_INTERVAL)
+                            break
+                        except queue.Empty:
+                            raise RuntimeError(
+                                f"Isolated transcription process exited without a result "
+                                f"(exit code {process.exitcode})"
+                            )
+        finally:
+            process.join()
+            
+        if not success:
+            raise RuntimeError(f"Isolated transcription failed: {result}")
+        return result, None
+
+    def supports_batching(self) -> bool:
+        """Check if the active backend can use the batched inference pipeline."""
+        return self.backend == "faster-whisper"
+
+    def get_batched_pipeline(self) -> BatchedInferencePipeline:
+        """Get a batched inference pipeline wrapping the loaded model."""
+        if not self.supports_batching():
+            raise RuntimeError(f"Batched inference is not supported by the {self.backend} backend")
+            
+        model = self.get_model()
+        if self.batched_pipeline is None:
+            logger.info("Creating batched inference pipeline")
+            self.batched_pipeline = BatchedInferencePipeline(model=model)
+        return self.batched_pipeline
+
+    def mark_in_use(self) -> None:
+        """Record that a transcription has started, so the idle timer leaves the model loaded."""
+        with self._model_lock:
+            self._active_uses += 1
+
+    def mark_idle(self) -> None:
+        """Record that a transcription has finished and restart the idle countdown from now."""
+        with self._model_lock:
+            self._active_uses = max(0, self._active_uses - 1)
+            self.last_use_time = time.monotonic()
+            if self.model is not None:
+                self._schedule_timeout()
+
+    def _schedule_timeout(self) -> None:
+        """Restart the idle timer that unloads the model after model_timeout seconds. Call with _model_lock held."""
+        if self._timeout_timer is not None:
+            self._timeout_timer.cancel()
+        self._timeout_timer = threading.Timer(self.model_timeout, self.check_timeout)
+        self._timeout_timer.daemon = True
+        self._timeout_timer.start()
+
     def check_timeout(self) -> None:
         """Check if model should be unloaded due to inactivity."""
-        if (self.model is not None and 
-            self.last_use_time is not None and 
-            time.time() - self.last_use_time > self.model_timeout):
-            logger.debug("Model timeout reached")
-            self.unload_model()
+        # Decide under the lock so a concurrent get_model can't hand out a model being unloaded
+        with self._model_lock:
+            if (self.model is not None and 
+                self._active_uses == 0 and
+                self.last_use_time is not None and 
+                time.monotonic() - self.last_use_time >= self.model_timeout):
+                logger.debug("Model timeout reached")
+                self._unload_model_locked()
 
     def unload_model(self) -> None:
         """Unload the model from memory to free up resources."""
+        with self._model_lock:
+            self._unload_model_locked()
+
+    def _unload_model_locked(self) -> None:
+        """Unload the model. Call with _model_lock held."""
         logger.info("Unloading model from memory")
         
         try:
+            # Stop the idle timer; it is rescheduled on the next load
+            if self._timeout_timer is not None:
+                self._timeout_timer.cancel()
+                self._timeout_timer = None
+                
             # Only proceed if model is loaded
             if self.model is not None:
-                # Keep a reference to the model before setting it to None
+                # Drop every reference so CTranslate2's destructor releases its thread pools
                 model_ref = self.model
                 self.model = None
+                self.batched_pipeline = None
+                del model_ref
                 
                 # Force garbage collection to clean up resources
                 gc.collect()
                 
-                # Explicitly clean up multiprocessing resources
-                try:
-                    # Check if resource_tracker exists and is running
-                    if hasattr(multiprocessing, 'resource_tracker') and multiprocessing.resource_tracker._resource_tracker:
-                        logger.info("Cleaning up multiprocessing resources")
-                        
-                        # Get all tracked resources
-                        if hasattr(multiprocessing.resource_tracker._resource_tracker, '_resources'):
-                            resources = multiprocessing.resource_tracker._resource_tracker._resources
-                            
-                            # Find and clean up semaphores
-                            for resource_type, resource_ids in list(resources.items()):
-                                if resource_type == 'semaphore':
-                                    logger.info(f"Found {len(resource_ids)} semaphore resources to clean")
-                                    for resource_id in list(resource_ids):
-                                        try:
-                                            # Unregister the semaphore
-                                            multiprocessing.resource_tracker.unregister(resource_id, 'semaphore')
-                                            logger.info(f"Unregistered semaphore: {resource_id}")
-                                        except Exception as e:
-                                            logger.error(f"Error unregistering semaphore {resource_id}: {e}")
-                except Exception as e:
-                    logger.error(f"Error cleaning up multiprocessing resources: {e}")
-                
                 # Reset the last model access time
                 self.last_use_time = None
                 logger.info("Model unloaded successfully")
@@ -604,6 +868,7 @@ class ModelManager:
         Returns:
             Dict containing system information:
             - cpu_cores: Number of physical CPU cores
+            - performance_cores: Number of performance CPU cores
             - memory_gb: Total system memory in GB
             - processor: Processor type
             - is_apple_silicon: Whether running on Apple Silicon
@@ -612,10 +877,11 @@ class ModelManager:
             cpu_count = psutil.cpu_count(logical=False)  # Physical CPU cores
             total_memory = psutil.virtual_memory().total / (1024 * 1024 * 1024)  # GB
             processor = platform.processor()
-            is_apple_silicon = 'arm' in processor.lower()
+            is_apple_silicon = detect_apple_silicon()
             
             system_info = {
                 "cpu_cores": cpu_count or 2,  # Fallback to 2 if detection fails
+                "performance_cores": PERFORMANCE_CORES,
                 "memory_gb": round(total_memory, 1),
                 "processor": processor,
                 "is_apple_silicon": is_apple_silicon
@@ -629,17 +895,26 @@ class ModelManager:
             # Return conservative defaults if detection fails
             return {
                 "cpu_cores": 2,
+                "performance_cores": 2,
                 "memory_gb": 8,
                 "processor": "unknown",
                 "is_apple_silicon": False
             }
 
+    def _record_performance_stat(self, key: str, value: float) -> None:
+        """Append a performance sample, keeping the running sum in step with the bounded history."""
+        stats = self.performance_stats[key]
+        if len(stats) == stats.maxlen:
+            self._perf_sums[key] -= stats[0]  # Oldest sample is about to be dropped
+        stats.append(value)
+        self._perf_sums[key] += value
+
     def get_performance_summary(self) -> Dict:
         """
         Get a summary of performance statistics.
         
         Returns:
-            Dict containing average load times, memory usage, and CPU usage
+            Dict containing average load times, memory usage, and CPU time (seconds)
         """
         if not self.performance_stats["load_times"]:
             return {
@@ -649,91 +924,7 @@ class ModelManager:
             }
             
         return {
-            "avg_load_time": sum(self.performance_stats["load_times"]) / len(self.performance_stats["load_times"]),
-            "avg_memory_usage": sum(self.performance_stats["memory_usage"]) / len(self.performance_stats["memory_usage"]),
-            "avg_cpu_usage": sum(self.performance_stats["cpu_usage"]) / len(self.performance_stats["cpu_usage"])
-        } 
-
-    def get_audio_settings(self, audio_duration: float) -> Dict:
-        """
-        Determine optimal settings based on audio length.
-        
-        Args:
-            audio_duration: Length of audio in seconds
-            
-        Returns:
-            Dict containing audio-specific settings
-        """
-        try:
-            if not self.current_model:
-                raise ValueError("No model selected")
-                
-            # Get base settings
-            settings = self.get_optimal_settings(self.current_model)
-            
-            # Adjust settings based on audio length
-            if audio_duration > 60:  # Long audio (>1 minute)
-                logger.info("Long audio detected, optimizing for memory efficiency")
-                settings["compute_type"] = "int8"  # Use int8 for longer audio
-                if settings["cpu_threads"] > 4:
-                    settings["cpu_threads"] = 4  # Reduce threads for longer audio
-                    
-            elif audio_duration < 10:  # Short audio (<10 seconds)
-                logger.info("Short audio detected, optimizing for speed")
-                if self.system_info["memory_gb"] >= 8:  # If enough memory
-                    settings["compute_type"] = "float16"  # Use float16 for better accuracy
-                    
-            logger.info(f"Audio-optimized settings: {settings}")
-            return settings
-            
-        except Exception as e:
-            logger.error(f"Error getting audio settings: {e}")
-            return self.get_optimal_settings(self.current_model)
-
-    def prepare_model_for_audio(self, audio_duration: float = 0) -> None:
-        """
-        Prepare model with optimal settings for audio length.
-        
-        Args:
-            audio_duration: Length of audio in seconds
-        """
-        try:
-            if self.model is None:
-                logger.info("Loading model for first time")
-                self.get_model()  # Initial load with default settings
-                return
-                
-            # Get current memory usage
-            _, memory_usage = self.check_memory_status()
-            
-            # Check if we need to reload with different settings
-            current_settings = self.get_optimal_settings(self.current_model)
-            audio_settings = self.get_audio_settings(audio_duration)
-            
-            # Decide if reload is needed
-            needs_reload = (
-                current_settings["compute_type"] != audio_settings["compute_type"] or
-                current_settings["cpu_threads"] != audio_settings["cpu_threads"] or
-                memory_usage > 0.85  # 85% memory usage threshold
-            )
-            
-            if needs_reload:
-                logger.info("Reloading model with audio-optimized settings")
-                self.unload_model()
-                
-                # Load with audio-optimized settings
-                self.model = WhisperModel(
-                    self.current_model,
-                    device="cpu",
-                    compute_type=audio_settings["compute_type"],
-                    cpu_threads=audio_settings["cpu_threads"],
-                    num_workers=audio_settings["num_workers"],
-                    download_root=str(self.cache_dir)
-                )
-                logger.info("Model reloaded with optimized settings")
-                
-        except Exception as e:
-            logger.error(f"Error preparing model: {e}")
-            # Fallback to regular model loading if preparation fails
-            if self.model is None:
-                self.get_model() 
\ No newline at end of file
+            "avg_load_time": self._perf_sums["load_times"] / len(self.performance_stats["load_times"]),
+            "avg_memory_usage": self._perf_sums["memory_usage"] / len(self.performance_stats["memory_usage"]),
+            "avg_cpu_usage": self._perf_sums["cpu_usage"] / len(self.performance_stats["cpu_usage"])
+        }
@@ -0,0 +1,87 @@
+#app/models/whisper_cpp_model.py
+
+import os
+import logging
+from typing import Iterable, Tuple
+import numpy as np
+
+# whisper.cpp is optional; it is only used on Apple Silicon when installed and enabled in the config
+try:
+    from pywhispercpp.model import Model as WhisperCppBackend
+    from pywhispercpp.constants import MODELS_DIR as WHISPER_CPP_MODELS_DIR
+except ImportError:
+    WhisperCppBackend = None
+    WHISPER_CPP_MODELS_DIR = None
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# whisper.cpp model names for each of the app's models
+WHISPER_CPP_MODELS = {
+    "tiny": "tiny",
+    "base": "base",
+    "small": "small",
+    "medium": "medium",
+    "large": "large-v3"
+}
+
+def is_whisper_cpp_available() -> bool:
+    """Check if the whisper.cpp bindings are installed."""
+    return WhisperCppBackend is not None
+
+def get_whisper_cpp_model_path(model_name: str) -> str:
+    """Get the path of the ggml model file whisper.cpp loads for one of the app's models."""
+    return os.path.join(str(WHISPER_CPP_MODELS_DIR), f"ggml-{WHISPER_CPP_MODELS[model_name]}.bin")
+
+class WhisperCppModel:
+    """Expose a whisper.cpp model through the faster-whisper transcribe interface."""
+
+    def __init__(self, model_name: str, cpu_threads: int = 4):
+        """
+        Load a whisper.cpp model.
+
+        Args:
+            model_name: Name of the model (tiny, base, small, medium, large)
+            cpu_threads: Number of threads for the parts not run on Core ML/Metal
+
+        Raises:
+            ImportError: If pywhispercpp is not installed
+            FileNotFoundError: If the ggml model file has not been downloaded
+        """
+        if WhisperCppBackend is None:
+            raise ImportError("pywhispercpp is not installed")
+
+        # Load from an explicit path so pywhispercpp never starts a download of its own
+        model_path = get_whisper_cpp_model_path(model_name)
+        if not os.path.isfile(model_path):
+            raise FileNotFoundError(
+                f"whisper.cpp model not found at {model_path}; download it with "
+                f"pywhispercpp.utils.download_model('{WHISPER_CPP_MODELS[model_name]}')"
+            )
+
+        logger.info(f"Loading whisper.cpp model: {model_path}")
+        # Beam search with a beam of 1 decodes greedily, so one model serves every beam size
+        self.model = WhisperCppBackend(
+            model_path,
+            n_threads=cpu_threads,
+            params_sampling_strategy=1,
+            print_progress=False,
+            print_realtime=False
+        )
+
+    def transcribe(self, audio: np.ndarray, beam_size: int = 1, **kwargs) -> Tuple[Iterable, None]:
+        """
+        Transcribe audio with whisper.cpp.
+
+        Args:
+            audio: 1-D float32 audio at 16kHz
+            beam_size: Number of beams to decode with
+            **kwargs: Other faster-whisper decoding options, which this backend does not support
+
+        Returns:
+            Tuple of (segments, None), matching the shape of WhisperModel.transcribe
+        """
+        if kwargs:
+            logger.debug(f"whisper.cpp backend ignoring options: {sorted(kwargs)}")
+        segments = self.model.transcribe(audio, beam_search={"beam_size": beam_size, "patience": -1.0})
+        return segments, None
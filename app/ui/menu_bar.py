@@ -5,13 +5,17 @@ import rumps
 import time
 import atexit
 import signal
-import sys
-import gc
-import multiprocessing
-import multiprocessing.resource_tracker
-import os
+from pynput import keyboard
+from PyObjCTools import AppHelper, MachSignals
+
+# Quartz is optional; without it the display sleep check is skipped
+try:
+    from Quartz import CGDisplayIsAsleep, CGMainDisplayID
+except ImportError:
+    CGDisplayIsAsleep = None
 from app.core.audio_processor import AudioProcessor
 from app.common.notifier import AudioNotifier
+from utils.logger import flush_logs
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -24,7 +28,14 @@ APP_STATES = {
     'completed': '✅'
 }
 
+# Seconds between icon animation frames
+ANIMATION_INTERVAL = 0.5
+
 class AudioTranscriberApp(rumps.App):
+    # Animation frames, indexed by the current animation phase
+    _PROC_ANIM = ('⏳', '⌛')
+    _REC_BLINK = (APP_STATES['recording'], '⚫')
+    
     def __init__(self):
         logger.debug("Initializing AudioTranscriberApp")
         super().__init__(
@@ -35,7 +46,17 @@ class AudioTranscriberApp(rumps.App):
         
         # Initialize state
         self.current_state = 'idle'
-        self.last_state_change = time.time()
+        self._stopped = False  # Set once stop() has run, so shutdown paths never clean up twice
+        self.last_state_change = time.monotonic()
+        
+        # Icon animation timer, only running while recording or processing
+        self._anim_timer = rumps.Timer(self.refresh_icon, ANIMATION_INTERVAL)
+        self._anim_phase = 0
+        self._state_deadline = 0.0  # Monotonic time the next animation frame is due
+        
+        # Process-wide global hotkey listener, shared by all processors
+        self.hotkeys = {}
+        self.listener = None
         
         # Initialize audio processor
         self.processor = AudioProcessor(self)
@@ -47,9 +68,6 @@ class AudioTranscriberApp(rumps.App):
             rumps.MenuItem("Quit", callback=self.quit_app)
         ]
         
-        # Set up periodic icon refresh
-        rumps.Timer(self.refresh_icon, 0.5).start()  # Refresh icon every half second
-        
         # Register cleanup for exit
         atexit.register(self.stop)
         
@@ -63,66 +81,103 @@ class AudioTranscriberApp(rumps.App):
         """Set up signal handlers for graceful shutdown."""
         logger.info("Setting up signal handlers")
         
-        def handle_signal(sig, frame):
+        def handle_signal(sig):
             """Handle termination signals by cleaning up and exiting."""
             signal_name = signal.Signals(sig).name
             logger.info(f"Received {signal_name} signal, shutting down gracefully")
             
-            # Clean up resources
+            # Clean up resources, then let the app quit normally instead of raising SystemExit
             self.stop()
-            
-            # Force exit after cleanup
             logger.info("Exiting application")
-            sys.exit(0)
+            flush_logs()
+            rumps.quit_application()
         
-        # Register signal handlers
-        signal.signal(signal.SIGINT, handle_signal)  # Ctrl+C
-        signal.signal(signal.SIGTERM, handle_signal)  # Termination request
+        # Deliver signals through a Mach port on the run loop. Python-level handlers only run
+        # when the main thread executes bytecode, which an idle NSApplication run loop never does
+        MachSignals.signal(signal.SIGINT, handle_signal)  # Ctrl+C
+        MachSignals.signal(signal.SIGTERM, handle_signal)  # Termination request
+
+    def register_hotkey(self, hotkey, callback):
+        """
+        Register a global hotkey, replacing any existing callback for it.
+        
+        Args:
+            hotkey: Hotkey in pynput format, e.g. '<cmd>+<shift>+9'
+            callback: Function called when the hotkey is pressed
+        """
+        self.hotkeys[hotkey] = callback
+        
+        # Restart the listener so it picks up the new mapping
+        if self.listener:
+            self.listener.stop()
+        self.listener = keyboard.GlobalHotKeys(self.hotkeys)
+        self.listener.start()
+        logger.debug(f"Registered hotkey: {hotkey}")
 
     def set_state(self, state):
         """Set the application state and update the icon."""
         if state in APP_STATES:
             self.current_state = state
             self.title = APP_STATES[state]
-            self.last_state_change = time.time()
+            self.last_state_change = time.monotonic()
+            self._anim_phase = 0
+            self._state_deadline = self.last_state_change + ANIMATION_INTERVAL
             logger.debug(f"App state changed to: {state}")
             
+            # Timers attach to the current run loop, so start and stop them on the main thread
+            if state in ('recording', 'processing'):
+                AppHelper.callAfter(self._anim_timer.start)
+            else:
+                AppHelper.callAfter(self._anim_timer.stop)
+            
             # Play sound notification for state changes
             if state == 'recording':
                 AudioNotifier.play_sound('start')
             elif state == 'completed':
                 AudioNotifier.play_sound('success')
-                # No need to schedule a separate timer - we'll handle this in refresh_icon
+                # Return to idle once, after 3 seconds
+                AppHelper.callAfter(AppHelper.callLater, 3.0, self._reset_completed)
+
+    def _reset_completed(self):
+        """Reset from completed to idle, unless the state has changed since."""
+        elapsed = time.monotonic() - self.last_state_change
+        if self.current_state == 'completed' and elapsed >= 3.0:
+            logger.debug(f"Auto-resetting from completed to idle after {elapsed:.1f} seconds")
+            self.current_state = 'idle'
+            self.title = APP_STATES['idle']
+            self.last_state_change = time.monotonic()
 
     def refresh_icon(self, _):
-        """Refresh the icon based on current state."""
-        # Check if we need to reset from completed to idle
-        if self.current_state == 'completed':
-            elapsed = time.time() - self.last_state_change
-            if elapsed >= 3.0:  # Reset after 3 seconds
-                logger.debug(f"Auto-resetting from completed to idle after {elapsed:.1f} seconds")
-                self.current_state = 'idle'
-                self.title = APP_STATES['idle']
-                self.last_state_change = time.time()
-                return
+        """Animate the icon while recording or processing."""
+        now = time.monotonic()
+        # Timer ticks can land slightly early, so allow a little slack before skipping a frame
+        if now < self._state_deadline - 0.05:
+            return
+        self._anim_phase ^= 1
+        self._state_deadline = now + ANIMATION_INTERVAL
+        
+        # Skip the title update when nobody can see the icon
+        if not self._icon_visible():
+            return
         
         # Add animation for processing state
         if self.current_state == 'processing':
-            elapsed = time.time() - self.last_state_change
-            animation_chars = ['⏳', '⌛']
-            self.title = animation_chars[int(elapsed * 2) % len(animation_chars)]
+            self.title = self._PROC_ANIM[self._anim_phase]
         
         # Blink for recording state
         elif self.current_state == 'recording':
-            elapsed = time.time() - self.last_state_change
-            if int(elapsed * 2) % 2 == 0:
-                self.title = APP_STATES['recording']
-            else:
-                self.title = '⚫'
-        
-        # For completed state, ensure it stays visible until timeout
-        elif self.current_state == 'completed':
-            self.title = APP_STATES['completed']
+            self.title = self._REC_BLINK[self._anim_phase]
+
+    def _icon_visible(self) -> bool:
+        """Check if the status item is on screen and the display is awake."""
+        try:
+            if CGDisplayIsAsleep is not None and CGDisplayIsAsleep(CGMainDisplayID()):
+                return False
+            window = self._nsapp.nsstatusitem.button().window()
+            return window is None or bool(window.isVisible())
+        except Exception:
+            # Assume visible if the status item can't be inspected
+            return True
 
     def quit_app(self, _):
         """Quit the application."""
@@ -131,28 +186,33 @@ class AudioTranscriberApp(rumps.App):
         # Stop all processes
         self.stop()
         
-        # Force garbage collection
-        logger.info("Forcing garbage collection")
-        gc.collect()
-        
-        # Give cleanup processes time to complete
-        time.sleep(0.5)
+        # Give the transcription worker up to half a second to finish, returning as soon as it does
+        if hasattr(self, 'processor'):
+            self.processor.transcription_thread.join(timeout=0.5)
         
         logger.info("Application shutdown complete")
+        # NSApplication exits without running logging.shutdown, so write out buffered logs now
+        flush_logs()
         rumps.quit_application()
 
     def stop(self):
-        """Stop all processes and clean up resources."""
+        """Stop all processes and clean up resources. Safe to call more than once."""
+        if self._stopped:
+            return
+        self._stopped = True
         logger.info("Stopping all processes")
         
+        # Stop the global hotkey listener
+        if getattr(self, 'listener', None):
+            logger.info("Stopping keyboard listener")
+            self.listener.stop()
+            self.listener = None
+        
         # Clean up audio processor
         if hasattr(self, 'processor'):
             logger.info("Cleaning up audio processor")
             self.processor.cleanup()
         
-        # Force garbage collection
-        gc.collect()
-        
         logger.info("All processes stopped")
 
     def toggle_recording(self, _):
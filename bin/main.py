@@ -19,12 +19,11 @@ warnings.filterwarnings("ignore",
 # Now import the rest of the modules
 import sys
 import os
-from pathlib import Path
 
-# Add the parent directory to the Python path
-current_dir = Path(__file__).resolve().parent
-parent_dir = current_dir.parent
-sys.path.insert(0, str(parent_dir))
+# Add the parent directory to the Python path, unless it is already there
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 # Import after path setup
 from bin import run_transcriber
@@ -2,40 +2,20 @@
 
 import sys
 import logging
-import signal
-import atexit
 
 from utils.logger import setup_logging
-from setup.setup_manager import SetupManager
-from app.models.model_manager import ModelManager
-from app.ui.menu_bar import main as run_app
 
-# Set up logging
-logger = setup_logging()
+# Set up logging; handlers are configured in main() so importing this module has no side effects
 logger = logging.getLogger(__name__)
 
-# Global reference to the app for signal handlers
-app_instance = None
-
-def signal_handler(sig, frame):
-    """Handle termination signals for graceful shutdown."""
-    logger.info(f"Received signal {sig}, shutting down gracefully...")
-    if app_instance:
-        try:
-            app_instance.quit_app(None)
-        except Exception as e:
-            logger.error(f"Error during signal-triggered shutdown: {e}")
-    sys.exit(0)
-
 def main():
     """Main entry point for the AudioTranscriber application."""
-    global app_instance
-    
-    # Set up signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Configure logging, clearing logs from the previous run
+    setup_logging()
     
     try:
+        # Heavy imports are deferred so they only load once the app actually starts
+        from app.models.model_manager import ModelManager
         model_manager = ModelManager()
         
         # Check if we have a model selected and if it exists
@@ -44,19 +24,20 @@ def main():
         # If no model exists or none is selected, run setup
         if not exists:
             logger.info("No model found or no model selected. Starting setup process...")
+            from setup.setup_manager import SetupManager
             setup_manager = SetupManager()
             if not setup_manager.run_setup():
                 logger.error("Setup was cancelled or failed. Exiting.")
                 sys.exit(1)
         
-        # Run the audio transcriber application
+        # Run the audio transcriber application; it installs its own signal handlers
         logger.info("Starting audio transcription...")
-        app_instance = run_app()
+        from app.ui.menu_bar import main as run_app
+        run_app()
         
     except KeyboardInterrupt:
+        # Interrupted during setup, before the app took over signal handling
         logger.info("Application terminated by user")
-        if app_instance:
-            app_instance.quit_app(None)
         sys.exit(0)
     except Exception as e:
         logger.error(f"Application failed: {e}", exc_info=True)
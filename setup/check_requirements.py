@@ -6,9 +6,9 @@
 import sys
 import os
 import platform
-import shutil
+import argparse
 import subprocess
-import importlib.util
+import importlib.metadata
 from pathlib import Path
 
 def check_python_version():
@@ -30,12 +30,22 @@ def check_os():
     print(f"✅ Operating System: macOS {platform.mac_ver()[0]}")
     return True
 
+def get_free_space_gb() -> float:
+    """Get free space in the home directory in GB."""
+    st = os.statvfs(os.path.expanduser("~"))
+    return st.f_bavail * st.f_frsize / (1024 ** 3)
+
 def check_disk_space():
     """Check if there's enough disk space (at least 2GB)."""
+    # A model is already downloaded, so the space requirement has been met before. Require a
+    # snapshot with model.bin, as ModelManager does, so a partial download doesn't count
+    model_cache = os.path.expanduser("~/.cache/huggingface/hub")
+    if any(Path(model_cache).glob("models--Systran--faster-whisper-*/snapshots/*/model.bin")):
+        print("✅ Disk space: model already downloaded")
+        return True
+    
     # Check space in home directory
-    home = Path.home()
-    total, used, free = shutil.disk_usage(home)
-    free_gb = free / (1024 ** 3)  # Convert to GB
+    free_gb = get_free_space_gb()
     
     if free_gb < 2:
         print(f"❌ Not enough disk space. At least 2GB required.")
@@ -49,6 +59,7 @@ def check_dependencies():
     required_packages = [
         "faster_whisper",
         "sounddevice",
+        "soundfile",
         "numpy",
         "pyperclip",
         "pynput",
@@ -56,11 +67,13 @@ def check_dependencies():
         "psutil"
     ]
     
-    missing_packages = []
-    
-    for package in required_packages:
-        if importlib.util.find_spec(package) is None:
-            missing_packages.append(package)
+    # Collect installed distribution names in one pass, normalized so faster-whisper matches faster_whisper
+    installed = {
+        name.lower().replace("-", "_")
+        for name in (dist.metadata["Name"] for dist in importlib.metadata.distributions())
+        if name
+    }
+    missing_packages = [package for package in required_packages if package.lower() not in installed]
     
     if missing_packages:
         print("❌ Missing required packages:")
@@ -72,18 +85,29 @@ def check_dependencies():
     print("✅ All required packages are installed.")
     return True
 
-def check_audio_devices():
-    """Check if audio input devices are available."""
+def check_audio_devices(verbose: bool = False):
+    """Check if an audio input device is available."""
     try:
         import sounddevice as sd
-        devices = sd.query_devices()
-        input_devices = [d for d in devices if d['max_input_channels'] > 0]
         
-        if not input_devices:
+        if verbose:
+            # Enumerate every device to report how many inputs there are
+            devices = sd.query_devices()
+            input_devices = [d for d in devices if d['max_input_channels'] > 0]
+            if not input_devices:
+                print("❌ No audio input devices found.")
+                return False
+            print(f"✅ Audio input devices available: {len(input_devices)}")
+            return True
+        
+        # Only look up the default input instead of loading every device driver
+        try:
+            device = sd.query_devices(kind='input')
+        except sd.PortAudioError:
             print("❌ No audio input devices found.")
             return False
         
-        print(f"✅ Audio input devices available: {len(input_devices)}")
+        print(f"✅ Audio input device present: {device['name']}")
         return True
     except Exception as e:
         print(f"❌ Error checking audio devices: {e}")
@@ -99,6 +123,10 @@ def check_permissions():
 
 def main():
     """Run all checks and report results."""
+    parser = argparse.ArgumentParser(description="Check AudioTranscriber system requirements")
+    parser.add_argument("--verbose", action="store_true", help="Count every audio input device")
+    args = parser.parse_args()
+    
     print("\n=== AudioTranscriber System Requirements Check ===\n")
     
     checks = [
@@ -106,7 +134,7 @@ def main():
         check_os(),
         check_disk_space(),
         check_dependencies(),
-        check_audio_devices(),
+        check_audio_devices(verbose=args.verbose),
         check_permissions()
     ]
     
@@ -6,9 +6,10 @@ import logging
 import subprocess
 import argparse
 import signal
+import select
 import time
+import psutil
 from pathlib import Path
-from app.models.model_manager import ModelManager
 from typing import Optional
 
 # Set up logging
@@ -18,7 +19,6 @@ class LaunchManager:
     """Manages the application launch process and modes."""
     
     def __init__(self):
-        self.model_manager = ModelManager()
         # Ensure logs directory exists
         logs_dir = Path("logs")
         logs_dir.mkdir(exist_ok=True)
@@ -27,9 +27,10 @@ class LaunchManager:
     def _read_pid(self) -> Optional[int]:
         """Read the PID from file if it exists."""
         try:
-            if self.pid_file.exists():
-                pid = int(self.pid_file.read_text().strip())
-                return pid
+            with open(self.pid_file) as f:
+                return int(f.read().strip())
+        except FileNotFoundError:
+            pass
         except (ValueError, IOError) as e:
             logger.error(f"Error reading PID file: {e}")
         return None
@@ -45,9 +46,10 @@ class LaunchManager:
     def _cleanup_pid(self) -> None:
         """Clean up the PID file."""
         try:
-            if self.pid_file.exists():
-                self.pid_file.unlink()
-                logger.debug("Removed PID file")
+            os.unlink(self.pid_file)
+            logger.debug("Removed PID file")
+        except FileNotFoundError:
+            pass
         except IOError as e:
             logger.error(f"Error removing PID file: {e}")
     
@@ -60,11 +62,28 @@ class LaunchManager:
         try:
             # Check if process exists
             os.kill(pid, 0)
-            return True
         except OSError:
             # Process doesn't exist
             self._cleanup_pid()
             return False
+        
+        if not self._verify_pid(pid):
+            # The PID was reused by an unrelated process
+            logger.info(f"Process {pid} is not the transcriber, ignoring stale PID file")
+            self._cleanup_pid()
+            return False
+        return True
+    
+    def _verify_pid(self, pid: int) -> bool:
+        """Check that a running process is the transcriber launched by _start_app."""
+        try:
+            cmdline = psutil.Process(pid).cmdline()
+            return any(arg.endswith("main.py") for arg in cmdline)
+        except psutil.NoSuchProcess:
+            return False
+        except psutil.Error:
+            # Can't inspect the process, so trust the PID file as before
+            return True
     
     def stop_running_instance(self) -> None:
         """Stop a running instance of the application."""
@@ -79,14 +98,7 @@ class LaunchManager:
             logger.info(f"Sent termination signal to process {pid}")
             
             # Wait for process to terminate
-            for _ in range(10):  # Wait up to 5 seconds
-                try:
-                    os.kill(pid, 0)  # Check if process exists
-                    time.sleep(0.5)
-                except OSError:
-                    # Process terminated
-                    break
-            else:
+            if not self._wait_for_exit(pid, timeout=5.0):
                 # Process didn't terminate, force kill
                 os.kill(pid, signal.SIGKILL)
                 logger.info(f"Force killed process {pid}")
@@ -96,6 +108,45 @@ class LaunchManager:
             logger.error(f"Error stopping process {pid}: {e}")
             self._cleanup_pid()
     
+    def _wait_for_exit(self, pid: int, timeout: float) -> bool:
+        """
+        Wait for a process to exit.
+        
+        Args:
+            pid: Process to wait for
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            True if the process exited, False if it was still running at the timeout
+        """
+        if hasattr(select, "kqueue"):
+            # Block in the kernel until the process exits instead of polling
+            kq = select.kqueue()
+            try:
+                event = select.kevent(
+                    pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                    fflags=select.KQ_NOTE_EXIT
+                )
+                return bool(kq.control([event], 1, timeout))
+            except ProcessLookupError:
+                # Process exited before the event could be registered
+                return True
+            finally:
+                kq.close()
+        
+        # Poll on platforms without kqueue
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                os.kill(pid, 0)  # Check if process exists
+                time.sleep(0.5)
+            except OSError:
+                # Process terminated
+                return True
+        return False
+    
     def launch(self, change_model: bool = False) -> None:
         """Launch the application."""
         # Check if already running
@@ -126,16 +177,31 @@ class LaunchManager:
         try:
             # Launch the application using Python from the bin directory
             cmd = [sys.executable, "bin/main.py"]
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True
-            )
+            try:
+                # posix_spawn starts the child without forking this interpreter first
+                pid = os.posix_spawn(
+                    sys.executable,
+                    cmd,
+                    os.environ,
+                    file_actions=[
+                        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0)
+                    ],
+                    setsid=True
+                )
+            except (AttributeError, NotImplementedError):
+                # No posix_spawn, or no setsid support on this platform
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
+                pid = process.pid
             
             # Write PID to file
-            self._write_pid(process.pid)
-            logger.info(f"Started application with PID {process.pid}")
+            self._write_pid(pid)
+            logger.info(f"Started application with PID {pid}")
         except Exception as e:
             logger.error(f"Error starting application: {e}")
 
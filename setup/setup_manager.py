@@ -12,10 +12,13 @@ class SetupManager:
 
     def __init__(self):
         self.model_manager = ModelManager()
+        # The model table is fixed, so look it up once for the whole setup flow
+        self._models = self.model_manager.get_available_models()
+        self._model_names = tuple(self._models)
 
     def display_model_options(self):
         """Display available models with their characteristics."""
-        models = self.model_manager.get_available_models()
+        models = self._models
         
         print("\nAvailable models:")
         print("-" * 60)
@@ -31,7 +34,7 @@ class SetupManager:
 
     def get_user_model_choice(self) -> Optional[str]:
         """Get user's model choice and validate it."""
-        models = list(self.model_manager.get_available_models().keys())
+        models = self._model_names
         
         while True:
             try:
@@ -78,14 +81,13 @@ class SetupManager:
             logger.info("Setup cancelled by user")
             return False
         
-        # Check if model already exists
-        if self.model_manager.check_model_exists(model_name):
+        # Check if model already exists and, if not, whether there is space for it
+        exists, has_space, message = self.model_manager.probe_model(model_name)
+        if exists:
             print(f"\nModel {model_name} is already downloaded.")
             self.model_manager.set_active_model(model_name)
             return True
         
-        # Check disk space
-        has_space, message = self.model_manager.check_disk_space(model_name)
         if not has_space:
             print(f"\nError: {message}")
             return False
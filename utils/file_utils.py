@@ -2,12 +2,16 @@
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Directories already created or confirmed to exist in this process
+_known_dirs: Set[str] = set()
+
 def ensure_directory_exists(directory_path: str) -> bool:
     """
     Ensure that a directory exists, creating it if necessary.
@@ -18,8 +22,12 @@ def ensure_directory_exists(directory_path: str) -> bool:
     Returns:
         True if the directory exists or was created, False otherwise
     """
+    if directory_path in _known_dirs:
+        return True
+        
     try:
         os.makedirs(directory_path, exist_ok=True)
+        _known_dirs.add(directory_path)
         return True
     except Exception as e:
         logger.error(f"Error creating directory {directory_path}: {e}")
@@ -36,8 +44,8 @@ def get_file_size(file_path: str) -> Optional[int]:
         Size of the file in bytes, or None if the file doesn't exist
     """
     try:
-        if os.path.exists(file_path):
-            return os.path.getsize(file_path)
+        return os.stat(file_path).st_size
+    except FileNotFoundError:
         return None
     except Exception as e:
         logger.error(f"Error getting file size for {file_path}: {e}")
@@ -54,17 +62,20 @@ def delete_file(file_path: str) -> bool:
         True if the file was deleted or didn't exist, False if there was an error
     """
     try:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            logger.debug(f"Deleted file: {file_path}")
+        os.remove(file_path)
+        logger.debug(f"Deleted file: {file_path}")
+        return True
+    except FileNotFoundError:
         return True
     except Exception as e:
         logger.error(f"Error deleting file {file_path}: {e}")
         return False
 
+@lru_cache(maxsize=1)
 def get_app_directory() -> Path:
     """
     Get the application directory for storing configuration and data.
+    The directory is created on the first call and cached afterwards.
     
     Returns:
         Path to the application directory
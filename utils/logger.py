@@ -2,30 +2,107 @@
 
 import os
 import sys
+import threading
 import logging
-from pathlib import Path
 
 # Get the project root directory (parent of the directory containing this file)
-project_root = Path(__file__).resolve().parent.parent
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-# Log directory and file paths
-log_dir = project_root / 'logs'
-log_file = log_dir / 'transcriber.log'
-error_log_file = log_dir / 'transcriber.error.log'
+# Log directory and file paths, kept as plain strings
+log_dir = os.path.join(project_root, 'logs')
+log_file = os.path.join(log_dir, 'transcriber.log')
+error_log_file = os.path.join(log_dir, 'transcriber.error.log')
+
+# Write buffer size for the main log file
+LOG_BUFFER_SIZE = 64 * 1024
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches writes, flushing on errors and from a background timer."""
+
+    def __init__(self, filename, buffer_size: int = LOG_BUFFER_SIZE, flush_interval: float = 1.0, **kwargs):
+        """
+        Initialize the handler.
+        
+        Args:
+            filename: Path of the log file
+            buffer_size: Size of the write buffer in bytes
+            flush_interval: Maximum number of seconds a record stays in the buffer
+        """
+        # Set before FileHandler.__init__, which may open the stream
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._dirty = False  # Records written since the last flush
+        self._closing = threading.Event()
+        super().__init__(filename, **kwargs)
+        
+        # Flush on a timer so a quiet period never leaves records sitting in the buffer
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def _flush_periodically(self):
+        """Flush buffered records every flush_interval seconds until the handler is closed."""
+        while not self._closing.wait(self.flush_interval):
+            if self._dirty:
+                self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._dirty = False
+            super().flush()
+        finally:
+            self.release()
+
+    def emit(self, record):
+        # Same as StreamHandler.emit, but without flushing after every record
+        if self.stream is None:
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+        if self.stream is None:
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            self._dirty = True
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._closing.set()
+        super().close()
+
+def flush_logs():
+    """Flush all root logger handlers, for exit paths that skip logging.shutdown."""
+    for handler in logging.getLogger().handlers:
+        try:
+            handler.flush()
+        except Exception:
+            pass
 
 def cleanup_logs():
     """Clean up all log files."""
     try:
-        # Ensure log directory exists
-        log_dir.mkdir(exist_ok=True)
+        # Ensure log directory exists; a stat is cheaper than a mkdir that fails with EEXIST
+        if not os.path.isdir(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
         
         # List of log files to clean
         log_files = [log_file, error_log_file]
         
         for file in log_files:
-            if file.exists():
-                file.unlink()
-                print(f"Cleaned up log file: {file}")  # Use print since logger isn't set up yet
+            # Unlink directly rather than stat first; a missing file is nothing to clean
+            try:
+                os.unlink(file)
+            except FileNotFoundError:
+                continue
+            print(f"Cleaned up log file: {file}")  # Use print since logger isn't set up yet
                 
     except Exception as e:
         print(f"Error cleaning up log files: {e}")
@@ -35,6 +112,11 @@ def setup_logging():
     # Clean old logs at startup
     cleanup_logs()
 
+    # The formatter never shows thread or process details, so don't collect them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Configure logging
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
@@ -47,13 +129,13 @@ def setup_logging():
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
-    # File handler for all logs
-    file_handler = logging.FileHandler(str(log_file))
+    # File handler for all logs, buffered to batch writes
+    file_handler = BufferedFileHandler(log_file)
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
 
-    # File handler for error logs only
-    error_file_handler = logging.FileHandler(str(error_log_file))
+    # File handler for error logs only, opened on the first error rather than at startup
+    error_file_handler = logging.FileHandler(error_log_file, delay=True)
     error_file_handler.setLevel(logging.ERROR)  # Only ERROR and CRITICAL
     error_file_handler.setFormatter(formatter)
     logger.addHandler(error_file_handler)